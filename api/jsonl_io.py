@@ -0,0 +1,50 @@
+"""
+JSONL I/O - read-ahead hints and the lazy line reader shared by the API routers
+
+Files are memory-mapped and split with mm.find, so lines are handed out as
+raw bytes without copying the whole file into the heap or decoding it to str.
+"""
+
+import mmap
+import os
+from typing import Iterator
+
+
+def advise_sequential(fd: int, size: int, willneed: bool = False) -> None:
+    """
+    Tell the kernel a file will be read front to back, where posix_fadvise exists.
+
+    willneed also prefetches the whole file, so it is only worth it for full scans.
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+        if willneed:
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+
+
+def iter_jsonl_lines(filepath: str, willneed: bool = False) -> Iterator[bytes]:
+    """
+    Yield the non-blank lines of a JSONL file as raw bytes.
+
+    Lines are produced lazily, so a caller that stops early never touches the
+    rest of the file. Pass willneed=True when the whole file will be read to
+    have the kernel prefetch all of it up front.
+    """
+    with open(filepath, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size == 0:
+            return
+        advise_sequential(f.fileno(), file_size, willneed)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = size
+                line = mm[start:end]
+                if line and not line.isspace():
+                    yield line
+                start = end + 1
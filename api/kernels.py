@@ -0,0 +1,75 @@
+"""
+Numba Kernels - compiled inner loops for the behavior and simulation routers
+
+The kernels are compiled with numba (cache=True, so the JIT cost is paid once
+per install) when it is installed and run as plain Python/NumPy otherwise.
+warm_up compiles them, or loads them from numba's on-disk cache, at startup.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels then run as plain Python/NumPy
+    njit = None
+
+# Date key for records whose timestamp cannot be parsed; date filters keep them
+NO_DATE = -1
+
+
+def _jit(fn: Callable) -> Callable:
+    """fn compiled with numba when it is installed, unchanged otherwise"""
+    return njit(cache=True)(fn) if njit is not None else fn
+
+
+@_jit
+def date_mask(date_keys: np.ndarray, date_lo: int, date_hi: int) -> np.ndarray:
+    """Row mask for the date range; rows without a parseable date (NO_DATE) always pass"""
+    return (date_keys == NO_DATE) | ((date_keys >= date_lo) & (date_keys <= date_hi))
+
+
+@_jit
+def shift_brands(
+    base: np.ndarray,
+    is_fresh_grad: np.ndarray,
+    coeff_fresh_grad: np.ndarray,
+    coeff_other: np.ndarray,
+    scale: float,
+    target: int,
+    first: int,
+    second: int,
+) -> np.ndarray:
+    """
+    Apply an event's brand shift to every persona/region row of base (n, 3).
+
+    Each row gets base + coeff * scale clamped to [0, 100]. With target >= 0
+    that brand column becomes 100 - first - second, otherwise the row is
+    normalized to sum to 100 (33.33 each if it sums to 0).
+    """
+    new = np.empty_like(base)
+    for i in range(base.shape[0]):
+        coeff = coeff_fresh_grad if is_fresh_grad[i] else coeff_other
+        for j in range(3):
+            new[i, j] = min(max(base[i, j] + coeff[j] * scale, 0.0), 100.0)
+
+        if target >= 0:
+            new[i, target] = max(0.0, 100.0 - new[i, first] - new[i, second])
+        else:
+            total = new[i, 0] + new[i, 1] + new[i, 2]
+            for j in range(3):
+                new[i, j] = new[i, j] / total * 100 if total > 0 else 33.33
+
+    return new
+
+
+def warm_up() -> None:
+    """Compile (or load from numba's on-disk cache) every kernel on dummy input"""
+    date_mask(np.array([NO_DATE, 20240101], dtype=np.int64), 20240101, np.iinfo(np.int64).max)
+
+    base = np.full((2, 3), 33.3)
+    is_fresh_grad = np.array([True, False])
+    coeff = np.zeros(3)
+    shift_brands(base, is_fresh_grad, coeff, coeff, 1.0, -1, -1, -1)
+    shift_brands(base, is_fresh_grad, coeff, coeff, 1.0, 0, 1, 2)
@@ -21,15 +21,16 @@ from typing import AsyncGenerator
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import orjson
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 
 from routers.behavior import router as behavior_router
 from routers.simulation import router as simulation_router
 from routers.metrics import router as metrics_router
-from models.schemas import ErrorResponse
+import kernels
 
 
 # Configuration
@@ -72,6 +73,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Startup
     print(f"🚀 Starting {API_TITLE} v{API_VERSION}")
     print(f"📊 Data path: {os.environ.get('DATA_PATH', '/app/data')}")
+    # Compile or load the cached simulation and date-filter kernels before the first request
+    kernels.warm_up()
     yield
     # Shutdown
     print(f"🛑 Shutting down {API_TITLE}")
@@ -99,23 +102,26 @@ app.add_middleware(
 
 
 # Exception handlers
+
+# Static part of the validation error payload; only "detail" varies
+_VALIDATION_ERROR_BODY = {
+    "success": False,
+    "error": "Validation Error",
+    "detail": None,
+    "status_code": 422,
+}
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors with detailed messages"""
-    errors = []
-    for error in exc.errors():
-        loc = " -> ".join(str(l) for l in error["loc"])
-        msg = error["msg"]
-        errors.append(f"{loc}: {msg}")
+    body = _VALIDATION_ERROR_BODY.copy()
+    body["detail"] = [f"{' -> '.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors()]
     
-    return JSONResponse(
+    return Response(
+        content=orjson.dumps(body),
         status_code=422,
-        content={
-            "success": False,
-            "error": "Validation Error",
-            "detail": errors,
-            "status_code": 422,
-        }
+        media_type="application/json",
     )
 
 
@@ -200,9 +206,17 @@ if __name__ == "__main__":
     print(f"🌐 Starting server on http://{host}:{port}")
     print(f"📚 API Documentation: http://{host}:{port}/docs")
     
+    debug = os.environ.get("DEBUG", "false").lower() == "true"
+    # Reload mode is single-process; otherwise fan out one worker per core
+    workers = 1 if debug else int(os.environ.get("API_WORKERS", os.cpu_count() or 1))
+    
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
-        reload=os.environ.get("DEBUG", "false").lower() == "true",
+        reload=debug,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=debug,
     )
@@ -2,20 +2,30 @@
 Behavior Data Router - FastAPI endpoints for behavior data retrieval
 """
 
-import json
+import asyncio
+import hashlib
 import os
-from datetime import datetime
-from pathlib import Path
-from typing import List, Optional, Dict, Any
+import threading
+from datetime import date, datetime
+from email.utils import formatdate
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, FrozenSet, Tuple, Type, TypeVar
 
-from fastapi import APIRouter, Query, HTTPException
+import numpy as np
+import orjson
+from fastapi import APIRouter, Query, HTTPException, Request, Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from jsonl_io import iter_jsonl_lines
+from kernels import NO_DATE, date_mask
 from models.schemas import (
     BehaviorResponse,
     BehaviorData,
-    BehaviorFilter,
     BehaviorSummary,
     DailyIntelReport,
     WebIntelResponse,
+    WeatherInfo,
+    HolidayEvent,
+    SocialPost,
 )
 
 router = APIRouter(prefix="/api/v1/behavior", tags=["Behavior Data"])
@@ -25,101 +35,422 @@ DATA_PATH = os.environ.get("DATA_PATH", "/Users/the_mini_bot/.openclaw/workspace
 WEB_INTEL_PATH = os.environ.get("WEB_INTEL_PATH", "/Users/the_mini_bot/.openclaw/workspace/digital_twin/web_intel")
 
 
-def read_jsonl_file(filepath: str) -> List[Dict[str, Any]]:
-    """Read and parse JSONL file"""
-    records = []
+# Normalize persona and region names (support both Chinese and English)
+_PERSONA_MAP = {
+    "fresh_grad": "新鮮人",
+    "新鮮人": "新鮮人",
+    "fresh_graduate": "新鮮人",
+    "fintech_family": "FinTech家庭",
+    "fintech家庭": "FinTech家庭",
+    "fintech family": "FinTech家庭",
+}
+_REGION_MAP = {
+    "taipei": "台北",
+    "台北": "台北",
+    "tainan": "台南",
+    "台南": "台南",
+}
+
+# Lowercased query value -> lowercased canonical name, resolved with one dict.get
+_PERSONA_TARGETS_LC = {alias: name.lower() for alias, name in _PERSONA_MAP.items()}
+_REGION_TARGETS_LC = {alias: name.lower() for alias, name in _REGION_MAP.items()}
+
+
+# Parsed JSONL cache: filepath -> (st_mtime_ns, st_size, records)
+_JSONL_CACHE: Dict[str, Tuple[int, int, List[Dict[str, Any]]]] = {}
+_JSONL_CACHE_LOCK = threading.Lock()
+
+
+def _parse_jsonl_file(filepath: str) -> List[Dict[str, Any]]:
+    """Read and parse every record of a JSONL file, straight from its raw line bytes"""
+    return [orjson.loads(line) for line in iter_jsonl_lines(filepath, willneed=True)]
+
+
+def _load_jsonl_entry(filepath: str) -> Tuple[int, int, List[Dict[str, Any]]]:
+    """Return the (st_mtime_ns, st_size, records) cache entry for a JSONL file, reloading it if stale"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    records.append(json.loads(line))
-        return records
+        st = os.stat(filepath)
+        cached = _JSONL_CACHE.get(filepath)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached
+
+        with _JSONL_CACHE_LOCK:
+            # Another request may have reloaded the file while we waited
+            cached = _JSONL_CACHE.get(filepath)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached
+
+            entry = (st.st_mtime_ns, st.st_size, _parse_jsonl_file(filepath))
+            _JSONL_CACHE[filepath] = entry
+        return entry
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Data file not found: {filepath}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise HTTPException(status_code=500, detail=f"Invalid JSON in file: {e}")
 
 
+def read_jsonl_file(filepath: str) -> List[Dict[str, Any]]:
+    """
+    Read and parse JSONL file.
+
+    Parsed records are cached per file and reused until the file's mtime or
+    size changes. The returned list is shared between requests and must be
+    treated as read-only.
+    """
+    return _load_jsonl_entry(filepath)[2]
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _required_fields(model: Type[BaseModel]) -> FrozenSet[str]:
+    """Names of the fields a model cannot default"""
+    return frozenset(name for name, field in model.model_fields.items() if field.is_required())
+
+
+def _build_trusted(model: Type[ModelT], record: Dict[str, Any]) -> ModelT:
+    """
+    Build a model from a record written by our own data pipeline.
+
+    Complete records skip validation via model_construct; records missing a
+    required key go through model_validate so the caller's error handling
+    still skips them.
+    """
+    if _required_fields(model) <= record.keys():
+        return model.model_construct(**record)
+    return model.model_validate(record)
+
+
+# Columnar view of the behavior file: filepath -> dataset built by _build_behavior_dataset
+_BEHAVIOR_DATASETS: Dict[str, Dict[str, Any]] = {}
+
+BRANDS = ("7-11", "FamilyMart", "Other")
+
+def _date_key(value: Any) -> int:
+    """
+    YYYYMMDD integer for a YYYY-MM-DD string, or NO_DATE if it does not parse.
+
+    Integer keys order like the dates themselves, so range filters become
+    plain integer compares. Zero-padded dates skip datetime.strptime; any
+    other layout strptime accepts (e.g. 2024-3-1) still goes through it.
+    """
+    if not isinstance(value, str):
+        return NO_DATE
+    try:
+        if (
+            len(value) == 10 and value[4] == "-" and value[7] == "-"
+            and value.isascii() and value[0:4].isdigit()
+            and value[5:7].isdigit() and value[8:10].isdigit()
+        ):
+            day = date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+        else:
+            day = datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return NO_DATE
+    return day.year * 10000 + day.month * 100 + day.day
+
+
+def _timestamp_date_key(timestamp: Any) -> int:
+    """Date key for the date part (first 10 characters) of a record timestamp"""
+    return _date_key(timestamp[:10]) if isinstance(timestamp, str) else NO_DATE
+
+
+def _as_float(value: Any) -> float:
+    """Numeric field value as a float; missing or non-numeric values count as 0"""
+    return float(value) if isinstance(value, (int, float)) else 0.0
+
+
+def _encode_categories(values: List[str]) -> Tuple[List[str], np.ndarray]:
+    """Encode string values as small integer codes into a sorted category list"""
+    categories, codes = np.unique(np.array(values, dtype=str), return_inverse=True)
+    return categories.tolist(), codes.astype(np.int32)
+
+
+def _encode_field(records: List[Dict[str, Any]], field: str) -> Tuple[List[str], np.ndarray]:
+    """
+    Encode one record field as category names and codes.
+
+    Rows without the field share one extra trailing category labelled
+    "Unknown" for the summary breakdown. Filter lookups are built from
+    names[:-1], so those rows never match a persona or region query.
+    """
+    present = np.fromiter((field in r for r in records), dtype=np.bool_, count=len(records))
+    names, present_codes = _encode_categories([r[field] for r in records if field in r])
+    codes = np.full(len(records), len(names), dtype=np.int32)
+    codes[present] = present_codes
+    return names + ["Unknown"], codes
+
+
+def _lowercase_codes(names: List[str]) -> Dict[str, List[int]]:
+    """Map each lowercased category name to the codes that share it"""
+    codes_lc: Dict[str, List[int]] = {}
+    for code, name in enumerate(names):
+        codes_lc.setdefault(name.lower(), []).append(code)
+    return codes_lc
+
+
+def _index_rows(codes: np.ndarray) -> Dict[int, np.ndarray]:
+    """Map each code to the ascending row numbers holding it"""
+    order = np.argsort(codes, kind="stable")
+    keys, starts = np.unique(codes[order], return_index=True)
+    return dict(zip(keys.tolist(), np.split(order, starts[1:])))
+
+
+def _count_by_category(codes: np.ndarray, names: List[str]) -> Dict[str, int]:
+    """Count rows per category, leaving out categories with no rows"""
+    counts = np.bincount(codes, minlength=len(names))
+    # Names may repeat (a real "Unknown" value and rows without the field)
+    by_name: Dict[str, int] = {}
+    for name, count in zip(names, counts.tolist()):
+        if count:
+            by_name[name] = by_name.get(name, 0) + count
+    return by_name
+
+
+def _summarize_behavior(dataset: Dict[str, Any]) -> Optional[BehaviorSummary]:
+    """Aggregate the non-event rows of a dataset, or None if there are none"""
+    rows = ~dataset["is_event"]
+    total_records = int(rows.sum())
+    if not total_records:
+        return None
+    
+    avg_satisfaction = float(dataset["avg_satisfaction"][rows].mean())
+    
+    brand_avg = dict(zip(BRANDS, dataset["brand_pcts"][rows].mean(axis=0).tolist()))
+    top_brand = max(brand_avg, key=brand_avg.get)
+    
+    return BehaviorSummary(
+        total_records=total_records,
+        average_satisfaction=round(avg_satisfaction, 3),
+        top_brand=top_brand,
+        brand_distribution_summary=brand_avg,
+        persona_breakdown=_count_by_category(dataset["group_codes"][rows], dataset["group_names"]),
+        region_breakdown=_count_by_category(dataset["region_codes"][rows], dataset["region_names"]),
+    )
+
+
+def _build_behavior_dataset(raw_records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Project behavior records into parallel NumPy columns (one row per record).
+
+    Simulation event rows and non-object lines are kept so row numbers match
+    raw_records, and are flagged in the is_event column. Only the remaining
+    behavior rows are read for the numeric columns; flagged rows stay 0.
+    """
+    n = len(raw_records)
+    # Non-object lines carry no fields; view them as empty records
+    views = [r if isinstance(r, dict) else {} for r in raw_records]
+    is_event = np.fromiter(
+        (not isinstance(r, dict) or "event" in r for r in raw_records), dtype=np.bool_, count=n
+    )
+    
+    group_names, group_codes = _encode_field(views, "group")
+    region_names, region_codes = _encode_field(views, "region")
+
+    date_keys = np.fromiter(
+        (_timestamp_date_key(r.get("timestamp")) for r in views), dtype=np.int64, count=n
+    )
+
+    avg_satisfaction = np.zeros(n, dtype=np.float64)
+    brand_pcts = np.zeros((n, len(BRANDS)), dtype=np.float64)
+    for i in np.flatnonzero(~is_event).tolist():
+        record = raw_records[i]
+        avg_satisfaction[i] = _as_float(record.get("avg_satisfaction", 0))
+        pcts = record.get("brand_percentages")
+        if isinstance(pcts, dict):
+            brand_pcts[i] = [_as_float(pcts.get(brand, 0)) for brand in BRANDS]
+
+    # Inverted indexes: category code(s) -> row numbers, in file order
+    n_regions = max(len(region_names), 1)
+    pair_rows = _index_rows(group_codes.astype(np.int64) * n_regions + region_codes)
+    by_group_region = {divmod(pair, n_regions): rows for pair, rows in pair_rows.items()}
+
+    dataset = {
+        "raw_records": raw_records,
+        "is_event": is_event,
+        "date_keys": date_keys,
+        "avg_satisfaction": avg_satisfaction,
+        "brand_pcts": brand_pcts,
+        "group_names": group_names,
+        "group_codes": group_codes,
+        "group_codes_lc": _lowercase_codes(group_names[:-1]),
+        "region_names": region_names,
+        "region_codes": region_codes,
+        "region_codes_lc": _lowercase_codes(region_names[:-1]),
+        "by_group": _index_rows(group_codes),
+        "by_region": _index_rows(region_codes),
+        "by_group_region": by_group_region,
+    }
+    # The summary only changes with the file, so aggregate once per load
+    dataset["summary"] = _summarize_behavior(dataset)
+    return dataset
+
+
+def load_behavior_dataset(filepath: str) -> Dict[str, Any]:
+    """
+    Return the columnar dataset for a behavior file.
+
+    The dataset is rebuilt only when the JSONL cache hands back a freshly
+    parsed record list, i.e. when the file itself changed.
+    """
+    mtime_ns, size, raw_records = _load_jsonl_entry(filepath)
+    dataset = _BEHAVIOR_DATASETS.get(filepath)
+    if dataset is not None and dataset["raw_records"] is raw_records:
+        return dataset
+
+    with _JSONL_CACHE_LOCK:
+        dataset = _BEHAVIOR_DATASETS.get(filepath)
+        if dataset is None or dataset["raw_records"] is not raw_records:
+            dataset = _build_behavior_dataset(raw_records)
+            dataset["mtime_ns"] = mtime_ns
+            dataset["size"] = size
+            _BEHAVIOR_DATASETS[filepath] = dataset
+    return dataset
+
+
+# Compiled list validators, reused across requests
+_BEHAVIOR_LIST_TA = TypeAdapter(List[BehaviorData])
+_DAILY_INTEL_LIST_TA = TypeAdapter(List[DailyIntelReport])
+_HOLIDAY_LIST_TA = TypeAdapter(List[HolidayEvent])
+_SOCIAL_POST_LIST_TA = TypeAdapter(List[SocialPost])
+
+
+def _validate_records(adapter: TypeAdapter, model: Type[ModelT], records: List[Any]) -> List[ModelT]:
+    """
+    Validate a batch of records with a single compiled list validator.
+
+    Records missing a required key are dropped up front. If the batch still
+    fails, records are validated one by one and the invalid ones skipped.
+    """
+    required = _required_fields(model)
+    candidates = [r for r in records if isinstance(r, dict) and required <= r.keys()]
+    try:
+        return adapter.validate_python(candidates)
+    except ValidationError:
+        valid = []
+        for record in candidates:
+            try:
+                valid.append(model.model_validate(record))
+            except ValidationError:
+                continue
+        return valid
+
+
+def _behavior_etag(dataset: Dict[str, Any], filters_applied: Dict[str, Any]) -> str:
+    """
+    Weak ETag for a behavior response: the file version plus the filters.
+
+    Uses a stable digest rather than hash() so every worker process hands
+    out the same tag for the same response.
+    """
+    digest = hashlib.blake2b(
+        orjson.dumps(filters_applied, option=orjson.OPT_SORT_KEYS), digest_size=8
+    ).hexdigest()
+    return f'W/"{dataset["mtime_ns"]:x}-{dataset["size"]:x}-{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header covers etag"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model to JSON bytes in a single pydantic-core pass.
+
+    Returning a raw Response skips FastAPI's response_model re-validation of
+    every nested record; the route's response_model still documents the schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _matching_codes(codes_lc: Dict[str, List[int]], target: str, normalized: str) -> List[int]:
+    """Codes of the categories whose lowercased name equals target or normalized"""
+    codes = codes_lc.get(target, [])
+    if normalized != target:
+        codes = codes + codes_lc.get(normalized, [])
+    return codes
+
+
+def _gather_rows(index: Dict[Any, np.ndarray], keys: List[Any]) -> np.ndarray:
+    """Union of the indexed rows for keys, in file order"""
+    parts = [index[key] for key in keys if key in index]
+    if not parts:
+        return np.empty(0, dtype=np.intp)
+    if len(parts) == 1:
+        return parts[0]
+    return np.sort(np.concatenate(parts))
+
+
+def _query_date_key(value: str, name: str) -> int:
+    """Date key for a YYYY-MM-DD query parameter"""
+    key = _date_key(value)
+    if key == NO_DATE:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: expected YYYY-MM-DD")
+    return key
+
+
 def filter_behavior_data(
-    records: List[Dict[str, Any]],
+    dataset: Dict[str, Any],
     persona: Optional[str] = None,
     region: Optional[str] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """Filter behavior data based on query parameters"""
-    filtered = records
+    group_codes = None
+    region_codes = None
     
-    # Normalize persona names (support both Chinese and English)
     if persona:
         persona_normalized = persona.lower()
-        persona_map = {
-            "fresh_grad": "新鮮人",
-            "新鮮人": "新鮮人",
-            "fresh_graduate": "新鮮人",
-            "fintech_family": "FinTech家庭",
-            "fintech家庭": "FinTech家庭",
-            "fintech family": "FinTech家庭",
-        }
-        persona_key = persona_normalized
-        persona_target = persona_map.get(persona_normalized, persona)
-        
-        def matches_persona(record: Dict) -> bool:
-            record_persona = record.get("group", "").lower()
-            return record_persona == persona_target.lower() or record_persona == persona_normalized
-        
-        filtered = [r for r in filtered if matches_persona(r)]
+        persona_target = _PERSONA_TARGETS_LC.get(persona_normalized, persona_normalized)
+        group_codes = _matching_codes(dataset["group_codes_lc"], persona_target, persona_normalized)
     
-    # Filter by region
     if region:
         region_normalized = region.lower()
-        region_map = {
-            "taipei": "台北",
-            "台北": "台北",
-            "tainan": "台南",
-            "台南": "台南",
-        }
-        region_target = region_map.get(region_normalized, region)
-        
-        def matches_region(record: Dict) -> bool:
-            record_region = record.get("region", "").lower()
-            return record_region == region_target.lower() or record_region == region_normalized
-        
-        filtered = [r for r in filtered if matches_region(r)]
+        region_target = _REGION_TARGETS_LC.get(region_normalized, region_normalized)
+        region_codes = _matching_codes(dataset["region_codes_lc"], region_target, region_normalized)
     
-    # Filter by date range
-    if start_date:
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        def after_start(record: Dict) -> bool:
-            try:
-                record_date = datetime.strptime(record.get("timestamp", "")[:10], "%Y-%m-%d")
-                return record_date >= start
-            except (ValueError, IndexError):
-                return True
-        filtered = [r for r in filtered if after_start(r)]
+    # Start from the inverted indexes instead of scanning every row
+    if group_codes is not None and region_codes is not None:
+        rows = _gather_rows(
+            dataset["by_group_region"], [(g, r) for g in group_codes for r in region_codes]
+        )
+    elif group_codes is not None:
+        rows = _gather_rows(dataset["by_group"], group_codes)
+    elif region_codes is not None:
+        rows = _gather_rows(dataset["by_region"], region_codes)
+    else:
+        rows = None
     
-    if end_date:
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        def before_end(record: Dict) -> bool:
-            try:
-                record_date = datetime.strptime(record.get("timestamp", "")[:10], "%Y-%m-%d")
-                return record_date <= end
-            except (ValueError, IndexError):
-                return True
-        filtered = [r for r in filtered if before_end(r)]
+    # Filter by date range
+    if start_date or end_date:
+        date_lo = _query_date_key(start_date, "start_date") if start_date else np.iinfo(np.int64).min
+        date_hi = _query_date_key(end_date, "end_date") if end_date else np.iinfo(np.int64).max
+        if rows is None:
+            rows = np.flatnonzero(date_mask(dataset["date_keys"], date_lo, date_hi))
+        else:
+            rows = rows[date_mask(dataset["date_keys"][rows], date_lo, date_hi)]
     
-    return filtered
+    raw_records = dataset["raw_records"]
+    if rows is None:
+        return raw_records
+    return [raw_records[i] for i in rows.tolist()]
 
 
 @router.get("", response_model=BehaviorResponse)
 async def get_behavior_data(
+    request: Request,
     persona: Optional[str] = Query(None, description="Filter by persona group"),
     region: Optional[str] = Query(None, description="Filter by region"),
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
-) -> BehaviorResponse:
+) -> Response:
     """
     Get behavior data with optional filters.
     
@@ -130,11 +461,28 @@ async def get_behavior_data(
     """
     # Read raw data
     behavior_file = os.path.join(DATA_PATH, "behavior_twin_monthly.jsonl")
-    raw_records = read_jsonl_file(behavior_file)
+    dataset = await asyncio.to_thread(load_behavior_dataset, behavior_file)
+    
+    filters_applied = {
+        "persona": persona,
+        "region": region,
+        "start_date": start_date,
+        "end_date": end_date,
+        "limit": limit,
+    }
+    
+    # Responses only change with the file, so polling clients can revalidate
+    etag = _behavior_etag(dataset, filters_applied)
+    cache_headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(dataset["mtime_ns"] / 1e9, usegmt=True),
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
     
     # Filter records
     filtered_records = filter_behavior_data(
-        raw_records,
+        dataset,
         persona=persona,
         region=region,
         start_date=start_date,
@@ -144,99 +492,49 @@ async def get_behavior_data(
     # Apply limit
     filtered_records = filtered_records[:limit]
     
-    # Parse into Pydantic models
-    behavior_data = []
-    for record in filtered_records:
-        try:
-            # Handle different record types (some are simulation events)
-            if "event" in record:
-                # Skip simulation events for basic behavior query
-                continue
-            
-            behavior_data.append(BehaviorData(**record))
-        except Exception as e:
-            # Skip invalid records but log warning
-            continue
-    
-    filters_applied = {
-        "persona": persona,
-        "region": region,
-        "start_date": start_date,
-        "end_date": end_date,
-        "limit": limit,
-    }
+    # Parse into Pydantic models, skipping simulation events and non-object lines
+    behavior_data = _validate_records(
+        _BEHAVIOR_LIST_TA,
+        BehaviorData,
+        [r for r in filtered_records if isinstance(r, dict) and "event" not in r],
+    )
     
-    return BehaviorResponse(
+    response = _json_response(BehaviorResponse(
         success=True,
         count=len(behavior_data),
         data=behavior_data,
         filters_applied=filters_applied,
-    )
+    ))
+    response.headers.update(cache_headers)
+    return response
 
 
 @router.get("/summary", response_model=BehaviorSummary)
-async def get_behavior_summary() -> BehaviorSummary:
+async def get_behavior_summary() -> Response:
     """
     Get aggregated behavior summary across all data.
     """
     behavior_file = os.path.join(DATA_PATH, "behavior_twin_monthly.jsonl")
-    raw_records = read_jsonl_file(behavior_file)
-    
-    # Filter out simulation events
-    records = [r for r in raw_records if "event" not in r]
+    dataset = await asyncio.to_thread(load_behavior_dataset, behavior_file)
     
-    if not records:
+    # Precomputed when the dataset was loaded; simulation events are excluded
+    summary = dataset["summary"]
+    if summary is None:
         raise HTTPException(status_code=404, detail="No behavior data found")
     
-    # Calculate aggregations
-    total_records = len(records)
-    
-    # Average satisfaction
-    avg_satisfaction = sum(r.get("avg_satisfaction", 0) for r in records) / total_records
-    
-    # Brand distribution summary
-    brand_totals = {"7-11": 0, "FamilyMart": 0, "Other": 0}
-    for r in records:
-        brand_dist = r.get("brand_percentages", {})
-        for brand, pct in brand_dist.items():
-            if brand in brand_totals:
-                brand_totals[brand] += pct
-    
-    brand_avg = {k: v / total_records for k, v in brand_totals.items()}
-    top_brand = max(brand_avg, key=brand_avg.get)
-    
-    # Persona breakdown
-    persona_counts = {}
-    for r in records:
-        persona = r.get("group", "Unknown")
-        persona_counts[persona] = persona_counts.get(persona, 0) + 1
-    
-    # Region breakdown
-    region_counts = {}
-    for r in records:
-        region = r.get("region", "Unknown")
-        region_counts[region] = region_counts.get(region, 0) + 1
-    
-    return BehaviorSummary(
-        total_records=total_records,
-        average_satisfaction=round(avg_satisfaction, 3),
-        top_brand=top_brand,
-        brand_distribution_summary=brand_avg,
-        persona_breakdown=persona_counts,
-        region_breakdown=region_counts,
-    )
+    return _json_response(summary)
 
 
 @router.get("/daily-intel", response_model=List[DailyIntelReport])
 async def get_daily_intel(
     date: Optional[str] = Query(None, description="Filter by specific date (YYYY-MM-DD)"),
     limit: int = Query(10, ge=1, le=100),
-) -> List[DailyIntelReport]:
+) -> Response:
     """
     Get daily intelligence reports.
     """
     intel_file = os.path.join(DATA_PATH, "daily_intel_report.jsonl")
-    raw_records = read_jsonl_file(intel_file)
+    raw_records = await asyncio.to_thread(read_jsonl_file, intel_file)
     
     # Filter by date if specified
     if date:
@@ -246,23 +544,21 @@ async def get_daily_intel(
     raw_records = raw_records[:limit]
     
     # Parse into models
-    intel_reports = []
-    for record in raw_records:
-        try:
-            intel_reports.append(DailyIntelReport(**record))
-        except Exception as e:
-            continue
+    intel_reports = _validate_records(_DAILY_INTEL_LIST_TA, DailyIntelReport, raw_records)
     
-    return intel_reports
+    return Response(
+        content=_DAILY_INTEL_LIST_TA.dump_json(intel_reports),
+        media_type="application/json",
+    )
 
 
 @router.get("/web-intel", response_model=WebIntelResponse)
-async def get_web_intel(date: Optional[str] = Query(None)) -> WebIntelResponse:
+async def get_web_intel(date: Optional[str] = Query(None)) -> Response:
     """
     Get web intelligence data including weather, holidays, and social posts.
     """
     web_file = os.path.join(WEB_INTEL_PATH, "daily_web_intel.jsonl")
-    raw_records = read_jsonl_file(web_file)
+    raw_records = await asyncio.to_thread(read_jsonl_file, web_file)
     
     # Filter by date if specified
     if date:
@@ -278,27 +574,20 @@ async def get_web_intel(date: Optional[str] = Query(None)) -> WebIntelResponse:
     weather = None
     if "weather" in record:
         try:
-            weather = WeatherInfo(**record["weather"])
+            weather = _build_trusted(WeatherInfo, record["weather"])
         except Exception:
             pass
     
-    holidays = []
-    if "holiday_events" in record:
-        for h in record["holiday_events"]:
-            try:
-                holidays.append(HolidayEvent(**h))
-            except Exception:
-                continue
+    holidays = _validate_records(
+        _HOLIDAY_LIST_TA, HolidayEvent, record.get("holiday_events", [])
+    )
     
-    posts = []
-    if "social_posts" in record:
-        for p in record["social_posts"][:20]:  # Limit to 20 posts
-            try:
-                posts.append(SocialPost(**p))
-            except Exception:
-                continue
+    # Limit to 20 posts
+    posts = _validate_records(
+        _SOCIAL_POST_LIST_TA, SocialPost, record.get("social_posts", [])[:20]
+    )
     
-    return WebIntelResponse(
+    return _json_response(WebIntelResponse(
         success=True,
         date=record.get("date", ""),
         weather=weather,
@@ -306,4 +595,4 @@ async def get_web_intel(date: Optional[str] = Query(None)) -> WebIntelResponse:
         social_posts=posts,
         trending_topics=record.get("trending_topics", []),
         market_insights=record.get("market_insights", []),
-    )
+    ))
@@ -3,10 +3,12 @@ Metrics Router - FastAPI endpoints for system health and metrics
 """
 
 import os
+import threading
 import time
 import psutil
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import wraps
+from typing import Callable, Dict, Any, Tuple, TypeVar
 
 from fastapi import APIRouter
 from models.schemas import HealthCheckResponse, MetricsResponse
@@ -20,23 +22,97 @@ STARTUP_TIME = time.time()
 DATA_PATH = os.environ.get("DATA_PATH", "/Users/the_mini_bot/.openclaw/workspace/digital_twin/monitoring/data")
 
 
+T = TypeVar("T")
+
+
+def ttl_cache(seconds: float) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """
+    Cache a zero-argument function's result for `seconds`.
+
+    Probe endpoints are polled far more often than the underlying state
+    changes; the cached value is shared and must not be modified.
+    """
+    def decorator(func: Callable[[], T]) -> Callable[[], T]:
+        lock = threading.Lock()
+        state: Dict[str, Any] = {"ts": 0.0, "val": None}
+        
+        @wraps(func)
+        def wrapper() -> T:
+            with lock:
+                now = time.monotonic()
+                if state["val"] is None or now - state["ts"] >= seconds:
+                    state["val"] = func()
+                    state["ts"] = now
+                return state["val"]
+        
+        return wrapper
+    
+    return decorator
+
+
+# Shared process handle; cpu_percent(interval=None) reports usage since the
+# previous call, so prime it once here instead of sleeping per request
+_PROCESS = psutil.Process()
+_PROCESS.cpu_percent(interval=None)
+
+# System metrics are re-sampled at most once per METRICS_TTL_SECONDS
+METRICS_TTL_SECONDS = 1.0
+
+# Data file checks are refreshed at most once per FILE_CHECK_TTL_SECONDS
+FILE_CHECK_TTL_SECONDS = 5.0
+
+# Check status codes; the worst code across checks picks the overall status
+CHECK_PASS = 0
+CHECK_WARN = 1
+CHECK_FAIL = 2
+OVERALL_STATUS = ("healthy", "degraded", "critical")
+
+
+@ttl_cache(METRICS_TTL_SECONDS)
 def get_system_metrics() -> Dict[str, Any]:
     """Get current system metrics"""
-    process = psutil.Process()
-    memory_info = process.memory_info()
-    cpu_percent = process.cpu_percent(interval=0.1)
+    memory_info = _PROCESS.memory_info()
     
     return {
         "memory_rss_mb": round(memory_info.rss / (1024 * 1024), 2),
-        "memory_percent": round(process.memory_percent(), 2),
-        "cpu_percent": round(cpu_percent, 2),
+        "memory_percent": round(_PROCESS.memory_percent(), 2),
+        "cpu_percent": round(_PROCESS.cpu_percent(interval=None), 2),
         "disk_usage_percent": round(psutil.disk_usage('/').percent, 2),
     }
 
 
-def check_data_sources() -> Dict[str, str]:
-    """Check availability of data sources"""
+@ttl_cache(FILE_CHECK_TTL_SECONDS)
+def _scan_data_dir() -> Dict[str, Any]:
+    """
+    Stat every .jsonl file in DATA_PATH in a single directory pass.
+
+    Returns {"files": {name: {"size": int, "readable": bool}}, "error": str or None};
+    shared by check_data_sources and check_file_accessibility.
+    """
+    files = {}
+    try:
+        with os.scandir(DATA_PATH) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.jsonl'):
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                files[entry.name] = {
+                    "size": size,
+                    "readable": entry.is_file() and os.access(entry.path, os.R_OK),
+                }
+    except Exception as e:
+        return {"files": files, "error": str(e)}
+    
+    return {"files": files, "error": None}
+
+
+def check_data_sources() -> Dict[str, Tuple[int, str]]:
+    """Check availability of data sources, as (status code, message) per file"""
     checks = {}
+    files = _scan_data_dir()["files"]
     
     data_files = [
         "behavior_twin_monthly.jsonl",
@@ -44,37 +120,40 @@ def check_data_sources() -> Dict[str, str]:
     ]
     
     for filename in data_files:
-        filepath = os.path.join(DATA_PATH, filename)
-        if os.path.exists(filepath):
-            size = os.path.getsize(filepath)
-            checks[filename] = f"pass ({size:,} bytes)"
+        info = files.get(filename)
+        if info is not None:
+            checks[filename] = (CHECK_PASS, f"pass ({info['size']:,} bytes)")
         else:
-            checks[filename] = "fail (file not found)"
+            checks[filename] = (CHECK_WARN, "fail (file not found)")
     
     return checks
 
 
-def check_file_accessibility() -> Dict[str, str]:
-    """Check if files can be read"""
-    checks = {}
+def check_file_accessibility() -> Dict[str, Tuple[int, str]]:
+    """Check if files can be read, as (status code, message) per file and overall"""
+    scan = _scan_data_dir()
     
-    try:
-        for filename in os.listdir(DATA_PATH):
-            if filename.endswith('.jsonl'):
-                filepath = os.path.join(DATA_PATH, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        line = f.readline()
-                    checks[filename] = "readable"
-                except Exception:
-                    checks[filename] = "read error"
-        checks["status"] = "pass"
-    except Exception as e:
-        checks["status"] = f"error: {str(e)}"
+    checks = {
+        filename: (CHECK_PASS, "readable") if info["readable"] else (CHECK_WARN, "read error")
+        for filename, info in scan["files"].items()
+    }
+    if scan["error"] is None:
+        checks["status"] = (CHECK_PASS, "pass")
+    else:
+        # DATA_PATH itself is missing or unreadable, so no data can be served
+        checks["status"] = (CHECK_FAIL, f"error: {scan['error']}")
     
     return checks
 
 
+def worst_check(*check_groups: Dict[str, Tuple[int, str]]) -> int:
+    """Highest status code across all checks (CHECK_PASS if there are none)"""
+    return max(
+        (code for checks in check_groups for code, _ in checks.values()),
+        default=CHECK_PASS,
+    )
+
+
 @router.get("/metrics", response_model=MetricsResponse)
 async def get_metrics() -> MetricsResponse:
     """
@@ -116,17 +195,8 @@ async def health_check() -> HealthCheckResponse:
     file_checks = check_file_accessibility()
     
     # Determine overall status
-    all_checks_pass = all(
-        "fail" not in str(v).lower() 
-        for v in {**data_checks, **file_checks}.values()
-    )
-    
-    if all_checks_pass:
-        status = "healthy"
-    elif any("fail" in str(v).lower() for v in {**data_checks, **file_checks}.values()):
-        status = "degraded"
-    else:
-        status = "critical"
+    worst = worst_check(data_checks, file_checks)
+    status = OVERALL_STATUS[worst]
     
     # Calculate uptime
     uptime_seconds = time.time() - STARTUP_TIME
@@ -137,8 +207,8 @@ async def health_check() -> HealthCheckResponse:
         timestamp=datetime.utcnow(),
         checks={
             "database": "pass (no db required)",
-            "data_sources": "pass" if all_checks_pass else "degraded",
-            "file_access": file_checks.get("status", "unknown"),
+            "data_sources": "pass" if worst == CHECK_PASS else "degraded",
+            "file_access": file_checks["status"][1],
             "memory": "pass" if system_metrics.get("memory_percent", 0) < 90 else "warning",
             "disk": "pass" if system_metrics.get("disk_usage_percent", 0) < 90 else "warning",
         },
@@ -162,12 +232,7 @@ async def readiness_check() -> Dict[str, Any]:
         data_checks = check_data_sources()
         file_checks = check_file_accessibility()
         
-        all_ok = all(
-            "fail" not in str(v).lower() 
-            for v in {**data_checks, **file_checks}.values()
-        )
-        
-        if all_ok:
+        if worst_check(data_checks, file_checks) == CHECK_PASS:
             return {"status": "ready", "message": "Service is ready"}
         else:
             return {"status": "not_ready", "message": "Data sources not available"}, 503
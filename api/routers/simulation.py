@@ -2,12 +2,17 @@
 Simulation Router - FastAPI endpoints for what-if analysis and digital twin simulation
 """
 
-import json
 import os
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Any, Tuple
 
-from fastapi import APIRouter, HTTPException
+import numpy as np
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from jsonl_io import iter_jsonl_lines
+from kernels import shift_brands
 from models.schemas import (
     SimulationRequest,
     SimulationResponse,
@@ -21,52 +26,240 @@ router = APIRouter(prefix="/api/v1/simulation", tags=["Simulation"])
 DATA_PATH = os.environ.get("DATA_PATH", "/Users/the_mini_bot/.openclaw/workspace/digital_twin/monitoring/data")
 
 
-def read_jsonl_file(filepath: str) -> List[Dict[str, Any]]:
-    """Read and parse JSONL file"""
-    records = []
+# Brand keys, interned once so lookups on JSON-decoded dicts take the
+# identity fast path
+_K711 = sys.intern("7-11")
+_KFAM = sys.intern("FamilyMart")
+_KOTHER = sys.intern("Other")
+
+# Brand columns of the baseline percentage arrays
+BRANDS = (_K711, _KFAM, _KOTHER)
+
+# Known personas and regions; the baseline is complete once it has every pair
+PERSONAS = ("新鮮人", "FinTech家庭")
+REGIONS = ("台北", "台南")
+_BASELINE_KEYS = frozenset(f"{group}_{region}" for group in PERSONAS for region in REGIONS)
+
+# Baseline cache: filepath -> (st_mtime_ns, st_size, baseline, baseline arrays)
+_BASELINE_CACHE: Dict[str, Tuple[int, int, Dict[str, Dict[str, Any]], Dict[str, Any]]] = {}
+_BASELINE_CACHE_LOCK = threading.Lock()
+
+
+def _read_baseline(filepath: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Stream the behavior file for the first non-simulation record of each persona/region.
+    
+    Reading stops as soon as every known persona/region pair has a baseline,
+    so simulation events appended to the file later are never parsed.
+    """
+    baseline = {}
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    records.append(json.loads(line))
-        return records
-    except FileNotFoundError:
-        return []
-    except Exception:
-        return []
+        for line in iter_jsonl_lines(filepath):
+            # Skip simulation events and lines that are not records
+            record = orjson.loads(line)
+            if not isinstance(record, dict) or "event" in record:
+                continue
+            
+            key = f"{record.get('group', '')}_{record.get('region', '')}"
+            if key not in baseline:
+                brand_pcts = record.get("brand_percentages", {})
+                if not isinstance(brand_pcts, dict):
+                    continue
+                # Pre-projected brand shares (missing brands as 0.0)
+                shares = (
+                    brand_pcts.get(_K711, 0.0),
+                    brand_pcts.get(_KFAM, 0.0),
+                    brand_pcts.get(_KOTHER, 0.0),
+                )
+                if not all(isinstance(share, (int, float)) for share in shares):
+                    continue
+                baseline[key] = {
+                    "group": record.get("group"),
+                    "region": record.get("region"),
+                    "brand_percentages": brand_pcts,
+                    "avg_satisfaction": record.get("avg_satisfaction", 0),
+                    "b_7_11": float(shares[0]),
+                    "b_family": float(shares[1]),
+                    "b_other": float(shares[2]),
+                }
+                if _BASELINE_KEYS <= baseline.keys():
+                    break
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    
+    return baseline
+
+
+def _build_baseline_arrays(baseline: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Lay the baseline out as parallel arrays, one row per persona/region.
+    
+    pcts is (n, 3) in BRANDS order from each entry's b_* shares; missing
+    marks the brands that were absent from the record. plans caches the
+    per-event/filter inputs built by _impact_plan.
+    """
+    entries = list(baseline.values())
+    
+    return {
+        "keys": np.array(list(baseline), dtype=object),
+        "groups": np.array([data["group"] for data in entries], dtype=object),
+        "regions": np.array([data["region"] for data in entries], dtype=object),
+        "pcts": np.array(
+            [(data["b_7_11"], data["b_family"], data["b_other"]) for data in entries],
+            dtype=np.float64,
+        ).reshape(-1, len(BRANDS)),
+        "missing": np.array(
+            [[brand not in data["brand_percentages"] for brand in BRANDS] for data in entries],
+            dtype=bool,
+        ).reshape(-1, len(BRANDS)),
+        "is_fresh_grad": np.array([data["group"] == "新鮮人" for data in entries], dtype=bool),
+        # Memoized _impact_plan results for this baseline
+        "plans": {},
+    }
+
+
+def _load_baseline() -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+    """Cached (baseline, baseline arrays), rebuilt when the behavior file's mtime or size changes"""
+    behavior_file = os.path.join(DATA_PATH, "behavior_twin_monthly.jsonl")
+    try:
+        st = os.stat(behavior_file)
+    except OSError:
+        return {}, _build_baseline_arrays({})
+    
+    cached = _BASELINE_CACHE.get(behavior_file)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cached[3]
+    
+    with _BASELINE_CACHE_LOCK:
+        # Another request may have rebuilt the baseline while we waited
+        cached = _BASELINE_CACHE.get(behavior_file)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3]
+        
+        baseline = _read_baseline(behavior_file)
+        arrays = _build_baseline_arrays(baseline)
+        _BASELINE_CACHE[behavior_file] = (st.st_mtime_ns, st.st_size, baseline, arrays)
+    return baseline, arrays
 
 
 def load_baseline_data() -> Dict[str, Dict[str, Any]]:
     """
     Load baseline behavior data for simulation comparison.
     Returns dict keyed by 'persona_region' -> baseline data
+    
+    The baseline is cached and only rebuilt when the behavior file's mtime
+    or size changes; the returned dict is shared and must not be modified.
     """
-    behavior_file = os.path.join(DATA_PATH, "behavior_twin_monthly.jsonl")
-    raw_records = read_jsonl_file(behavior_file)
+    return _load_baseline()[0]
+
+
+# Per-event brand shifts in BRANDS order for Fresh_Grad and every other
+# persona, multiplied by the event's _EVENT_SCALE factor (1.0 if absent)
+EVENT_COEFFS: Dict[str, Dict[str, np.ndarray]] = {
+    # Electricity price increase: price-sensitive Fresh_Grad shifts to cheaper
+    # options, FinTech_Family more resilient but efficiency-focused
+    "price_change": {
+        "fresh_grad": np.array([-0.08, -0.07, 0.15]),
+        "other": np.array([-0.05, -0.05, 0.10]),
+    },
+    # Strong promotion shifts to point-friendly stores
+    "promotion": {
+        "fresh_grad": np.array([0.0, 1.0, -0.5]),
+        "other": np.array([0.0, 1.0, -0.5]),
+    },
+    # Competitor action (e.g., FamilyMart ice cream promo);
+    # Fresh_Grad highly responsive, FinTech_Family less so
+    "competition": {
+        "fresh_grad": np.array([-3.0, 8.0, 0.0]),
+        "other": np.array([-2.0, 4.0, 0.0]),
+    },
+    # Positive external event (weather, holidays)
+    "external": {
+        "fresh_grad": np.array([2.0, 1.0, -3.0]),
+        "other": np.array([2.0, 1.0, -3.0]),
+    },
+}
+
+_EVENT_SCALE: Dict[str, Callable[[SimulationParameters], float]] = {
+    "price_change": lambda params: params.electricity_price - 1.0,  # 0 = no change
+    "promotion": lambda params: (params.promotion_intensity - 1) * 0.12 * params.point_multiplier,
+}
+
+# Events whose brand column `target` becomes 100 - first - second after the
+# shift, as (target, first, second); all other events are normalized to 100
+# (_NORMALIZE)
+_EVENT_REMAINDER: Dict[str, Tuple[int, int, int]] = {
+    "promotion": (0, 1, 2),
+    "competition": (2, 1, 0),
+}
+_NORMALIZE = (-1, -1, -1)
+
+# Events that start brands missing from the baseline at 33.33 instead of 0
+_EVEN_SPLIT_EVENTS = frozenset({"external"})
+
+
+# Filter values whose plans are memoized; arbitrary user-supplied filters
+# are planned per request so they cannot grow the cache without bound
+_PLAN_PERSONAS = frozenset({None, *PERSONAS})
+_PLAN_REGIONS = frozenset({None, *REGIONS})
+
+
+def _impact_plan(
+    baseline_arrays: Dict[str, Any],
+    event_type: str,
+    persona: Optional[str],
+    region: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Inputs for calculate_impact that only depend on the event and filters.
     
-    # Build baseline lookup - use first non-simulation record for each persona/region
-    baseline = {}
-    for record in raw_records:
-        if "event" in record:  # Skip simulation events
-            continue
-        
-        key = f"{record.get('group', '')}_{record.get('region', '')}"
-        if key not in baseline:
-            baseline[key] = {
-                "group": record.get("group"),
-                "region": record.get("region"),
-                "brand_percentages": record.get("brand_percentages", {}),
-                "avg_satisfaction": record.get("avg_satisfaction", 0),
-            }
+    The row selection, starting shares, coefficients and output labels are
+    resolved once per (event_type, persona, region) and cached on the
+    baseline arrays, so a request only applies its parameter scale.
+    """
+    persona = persona or None
+    region = region or None
+    plan_key = (event_type, persona, region)
+    plans = baseline_arrays["plans"]
+    plan = plans.get(plan_key)
+    if plan is not None:
+        return plan
     
-    return baseline
+    # Apply persona/region filters
+    rows = np.ones(len(baseline_arrays["keys"]), dtype=bool)
+    if persona:
+        rows &= baseline_arrays["groups"] == persona
+    if region:
+        rows &= baseline_arrays["regions"] == region
+    
+    base = baseline_arrays["pcts"][rows]
+    coeffs = EVENT_COEFFS.get(event_type)
+    if coeffs is None or event_type in _EVEN_SPLIT_EVENTS:
+        start = np.where(baseline_arrays["missing"][rows], 33.33, base)
+    else:
+        start = base
+    
+    plan = {
+        "start": start,
+        "is_fresh_grad": baseline_arrays["is_fresh_grad"][rows],
+        "coeffs": coeffs,
+        "remainder": _EVENT_REMAINDER.get(event_type, _NORMALIZE),
+        "labels": list(zip(
+            baseline_arrays["keys"][rows],
+            baseline_arrays["groups"][rows],
+            baseline_arrays["regions"][rows],
+        )),
+        "base": base.T.tolist(),
+    }
+    if coeffs is not None and persona in _PLAN_PERSONAS and region in _PLAN_REGIONS:
+        plans[plan_key] = plan
+    return plan
 
 
 def calculate_impact(
     event_type: str,
     params: SimulationParameters,
-    baseline: Dict[str, Dict],
+    baseline_arrays: Dict[str, Any],
     persona: Optional[str] = None,
     region: Optional[str] = None,
 ) -> Dict[str, SimulationEventResult]:
@@ -75,132 +268,94 @@ def calculate_impact(
     
     This is a simplified simulation model - in production, this would be
     replaced with a trained ML model or more sophisticated simulation engine.
+    Every persona/region row is shifted by the event's coefficients from
+    EVENT_COEFFS in one call to the compiled shift_brands kernel.
     """
-    results = {}
-    
-    for key, data in baseline.items():
-        # Apply persona/region filters
-        if persona and data["group"] != persona:
-            continue
-        if region and data["region"] != region:
-            continue
-        
-        baseline_pcts = data["brand_percentages"]
-        
-        # Calculate impact based on event type
-        if event_type == "price_change":
-            # Electricity price increase affects different personas differently
-            electricity_factor = params.electricity_price - 1.0  # 0 = no change
-            
-            # Price-sensitive groups (Fresh_Grad) more affected
-            if data["group"] == "新鮮人":
-                # Fresh_Grad shifts to cheaper options
-                shift_to_other = electricity_factor * 0.15
-                shift_from_7_11 = electricity_factor * 0.08
-                shift_from_family = electricity_factor * 0.07
-            else:
-                # FinTech_Family more resilient but efficiency-focused
-                shift_to_other = electricity_factor * 0.10
-                shift_from_7_11 = electricity_factor * 0.05
-                shift_from_family = electricity_factor * 0.05
-            
-            new_7_11 = max(0, baseline_pcts.get("7-11", 0) - shift_from_7_11)
-            new_family = max(0, baseline_pcts.get("FamilyMart", 0) - shift_from_family)
-            new_other = min(100, baseline_pcts.get("Other", 0) + shift_to_other)
-            
-            # Normalize
-            total = new_7_11 + new_family + new_other
-            new_7_11 = (new_7_11 / total) * 100 if total > 0 else 33.33
-            new_family = (new_family / total) * 100 if total > 0 else 33.33
-            new_other = (new_other / total) * 100 if total > 0 else 33.33
-            
-        elif event_type == "promotion":
-            # Promotion affects based on intensity and point multiplier
-            promotion_factor = params.promotion_intensity
-            point_factor = params.point_multiplier
-            
-            # Strong promotion shifts to point-friendly stores
-            shift_to_family = (promotion_factor - 1) * 0.12 * point_factor
-            shift_from_other = shift_to_family * 0.5
-            
-            new_family = min(100, baseline_pcts.get("FamilyMart", 0) + shift_to_family)
-            new_other = max(0, baseline_pcts.get("Other", 0) - shift_from_other)
-            new_7_11 = 100 - new_family - new_other
-            
-            new_7_11 = max(0, new_7_11)
-            
-        elif event_type == "competition":
-            # Competitor action (e.g., FamilyMart ice cream promo)
-            if data["group"] == "新鮮人":
-                # Fresh_Grad highly responsive to promotions
-                new_family = min(100, baseline_pcts.get("FamilyMart", 0) + 8.0)
-                new_7_11, baseline_pcts.get("7- = max(011", 0) - 3.0)
-                new_other = max(0, 100 - new_family - new_7_11)
-            else:
-                # FinTech_Family less responsive
-                new_family = min(100, baseline_pcts.get("FamilyMart", 0) + 4.0)
-                new_7_11 = max(0, baseline_pcts.get("7-11", 0) - 2.0)
-                new_other = max(0, 100 - new_family - new_7_11)
-        
-        elif event_type == "external":
-            # External factors (weather, holidays)
-            # Simulate positive external event
-            new_7_11 = baseline_pcts.get("7-11", 33.33) + 2.0
-            new_family = baseline_pcts.get("FamilyMart", 33.33) + 1.0
-            new_other = baseline_pcts.get("Other", 33.33) - 3.0
-            
-            new_other = max(0, new_other)
-            total = new_7_11 + new_family + new_other
-            new_7_11 = (new_7_11 / total) * 100
-            new_family = (new_family / total) * 100
-            new_other = (new_other / total) * 100
-        
-        else:
-            # Unknown event type, no change
-            new_7_11 = baseline_pcts.get("7-11", 33.33)
-            new_family = baseline_pcts.get("FamilyMart", 33.33)
-            new_other = baseline_pcts.get("Other", 33.33)
-        
-        results[key] = SimulationEventResult(
-            group=data["group"],
-            region=data["region"],
-            brand_7_11=round(new_7_11, 1),
-            brand_family=round(new_family, 1),
-            brand_other=round(new_other, 1),
+    plan = _impact_plan(baseline_arrays, event_type, persona, region)
+    
+    coeffs = plan["coeffs"]
+    if coeffs is None:
+        # Unknown event type, no change
+        new = plan["start"]
+    else:
+        scale = _EVENT_SCALE[event_type](params) if event_type in _EVENT_SCALE else 1.0
+        new = shift_brands(
+            plan["start"],
+            plan["is_fresh_grad"],
+            coeffs["fresh_grad"],
+            coeffs["other"],
+            float(scale),
+            *plan["remainder"],
+        )
+    
+    # Values are computed from the validated baseline, so skip re-validation
+    return {
+        key: SimulationEventResult.model_construct(
+            group=group,
+            region=region_name,
+            brand_7_11=round(n_7_11, 1),
+            brand_family=round(n_family, 1),
+            brand_other=round(n_other, 1),
             change_from_baseline={
-                "7-11": round(new_7_11 - baseline_pcts.get("7-11", 0), 1),
-                "FamilyMart": round(new_family - baseline_pcts.get("FamilyMart", 0), 1),
-                "Other": round(new_other - baseline_pcts.get("Other", 0), 1),
+                _K711: round(n_7_11 - b_7_11, 1),
+                _KFAM: round(n_family - b_family, 1),
+                _KOTHER: round(n_other - b_other, 1),
             }
         )
+        for (key, group, region_name), n_7_11, n_family, n_other, b_7_11, b_family, b_other in zip(
+            plan["labels"],
+            *new.T.tolist(),
+            *plan["base"],
+        )
+    }
+
+
+def _aggregate_results(results: Dict[str, SimulationEventResult]) -> Tuple[Dict[str, float], float]:
+    """
+    Reduce simulation results in a single pass.
     
-    return results
+    Returns (average change per brand, average absolute brand shift).
+    """
+    sum_7_11 = sum_family = sum_other = 0.0
+    sum_abs = 0.0
+    for result in results.values():
+        changes = result.change_from_baseline
+        change_7_11 = changes[_K711]
+        change_family = changes[_KFAM]
+        change_other = changes[_KOTHER]
+        sum_7_11 += change_7_11
+        sum_family += change_family
+        sum_other += change_other
+        sum_abs += abs(change_7_11) + abs(change_family) + abs(change_other)
+    
+    if not results:
+        return {_K711: 0, _KFAM: 0, _KOTHER: 0}, 0
+    
+    count = len(results)
+    avg_changes = {
+        _K711: sum_7_11 / count,
+        _KFAM: sum_family / count,
+        _KOTHER: sum_other / count,
+    }
+    return avg_changes, sum_abs / (count * 3)
 
 
 def generate_insights(
     event_type: str,
-    results: Dict[str, SimulationEventResult],
+    avg_changes: Dict[str, float],
     params: SimulationParameters,
 ) -> List[str]:
-    """Generate business insights from simulation results"""
+    """Generate business insights from the average per-brand changes"""
     insights = []
     
-    # Calculate aggregate changes
-    avg_changes = {"7-11": 0, "FamilyMart": 0, "Other": 0}
-    for result in results.values():
-        for brand, change in (result.change_from_baseline or {}).items():
-            avg_changes[brand] += change
-    
-    avg_changes = {k: v / len(results) if results else 0 for k, v in avg_changes.items()}
-    
     # Generate insights based on event type
     if event_type == "price_change":
         if params.electricity_price > 1.0:
             insights.append(f"電價調漲 {int((params.electricity_price - 1) * 100)}% 將導致外食預算緊縮")
-            if avg_changes.get("Other", 0) > 0:
-                insights.append(f"平價品牌 Other 預估成長 {avg_changes['Other']:.1f} 百分點")
-            if avg_changes.get("7-11", 0) < 0:
-                insights.append(f"7-11 預估下降 {abs(avg_changes['7-11']):.1f} 百分點 (價格敏感客群流失)")
+            if avg_changes.get(_KOTHER, 0) > 0:
+                insights.append(f"平價品牌 Other 預估成長 {avg_changes[_KOTHER]:.1f} 百分點")
+            if avg_changes.get(_K711, 0) < 0:
+                insights.append(f"7-11 預估下降 {abs(avg_changes[_K711]):.1f} 百分點 (價格敏感客群流失)")
         else:
             insights.append("電價維持不變，消費行為無顯著變化")
     
@@ -209,12 +364,12 @@ def generate_insights(
             insights.append(f"促銷強度 {params.promotion_intensity}x 將有效吸引價格敏感客群")
             if params.point_multiplier > 1.0:
                 insights.append(f"點數 {params.point_multiplier}x 加成提升會員黏著度")
-        if avg_changes.get("FamilyMart", 0) > 0:
-            insights.append(f"全家便利商店預估獲益最大 (+{avg_changes['FamilyMart']:.1f} 百分點)")
+        if avg_changes.get(_KFAM, 0) > 0:
+            insights.append(f"全家便利商店預估獲益最大 (+{avg_changes[_KFAM]:.1f} 百分點)")
     
     elif event_type == "competition":
         insights.append("監測競合品牌促銷動態，及時調整策略")
-        if avg_changes.get("FamilyMart", 0) > 0:
+        if avg_changes.get(_KFAM, 0) > 0:
             insights.append("全家冰淇淋促銷對新鮮人族群吸引力最強")
     
     elif event_type == "external":
@@ -229,22 +384,16 @@ def generate_insights(
 
 def calculate_projected_impact(
     event_type: str,
-    results: Dict[str, SimulationEventResult],
+    total_shift: float,
+    n_results: int,
     params: SimulationParameters,
 ) -> Dict[str, float]:
-    """Calculate projected revenue/impact metrics"""
+    """Calculate projected revenue/impact metrics from the average absolute brand shift"""
     # Simplified impact calculation
-    total_shift = sum(
-        abs(r.change_from_baseline.get("7-11", 0)) +
-        abs(r.change_from_baseline.get("FamilyMart", 0)) +
-        abs(r.change_from_baseline.get("Other", 0))
-        for r in results.values()
-    ) / (len(results) * 3) if results else 0
-    
     impact = {
         "avg_brand_shift_percent": round(total_shift, 2),
         "confidence_score": 0.85,
-        "affected_personas": len(results),
+        "affected_personas": n_results,
     }
     
     if event_type == "price_change":
@@ -257,68 +406,98 @@ def calculate_projected_impact(
     return impact
 
 
-@router.get("", response_model=Dict)
-async def get_simulation_parameters() -> Dict:
+# Static simulation parameter catalogue, serialized once at import
+_PARAMS_DICT: Dict[str, Any] = {
+    "event_types": [
+        {"id": "price_change", "name": "電價/價格變動", "description": "模擬價格變化對消費行為的影響"},
+        {"id": "promotion", "name": "促銷活動", "description": "模擬折扣、點數等促銷效果"},
+        {"id": "competition", "name": "競合變化", "description": "模擬競爭對手動作"},
+        {"id": "external", "name": "外部因素", "description": "天氣、節慶等外部因素"},
+    ],
+    "parameters": {
+        "electricity_price": {
+            "type": "float",
+            "range": [0.5, 3.0],
+            "default": 1.0,
+            "description": "電價倍數 (1.0 = 無變化)",
+        },
+        "point_multiplier": {
+            "type": "float",
+            "range": [0.5, 5.0],
+            "default": 1.0,
+            "description": "點數加成倍率",
+        },
+        "promotion_intensity": {
+            "type": "float",
+            "range": [0.0, 2.0],
+            "default": 1.0,
+            "description": "促銷強度 (0-2)",
+        },
+        "price_sensitivity": {
+            "type": "float",
+            "range": [0.5, 2.0],
+            "default": 1.0,
+            "description": "消費者價格敏感度",
+        },
+    },
+    "personas": [*PERSONAS, None],
+    "regions": [*REGIONS, None],
+    "duration_days": {"min": 1, "max": 365, "default": 30},
+}
+_PARAMS_BYTES = orjson.dumps(_PARAMS_DICT)
+
+# Static part of the simulation response metadata
+_META_BASE = {"model_version": "1.0.0"}
+
+# Accepted /simulate inputs, checked before any file I/O
+_VALID_EVENTS = frozenset(EVENT_COEFFS)
+_VALID_PERSONAS = frozenset(PERSONAS)
+_VALID_REGIONS = frozenset(REGIONS)
+
+# Display names for each event type
+_EVENT_NAMES = {
+    "price_change": "電價調漲",
+    "promotion": "促銷活動",
+    "competition": "競合變化",
+    "external": "外部因素",
+}
+
+
+@router.get("")
+async def get_simulation_parameters() -> Response:
     """
     Get available simulation parameters and their ranges.
     """
-    return {
-        "event_types": [
-            {"id": "price_change", "name": "電價/價格變動", "description": "模擬價格變化對消費行為的影響"},
-            {"id": "promotion", "name": "促銷活動", "description": "模擬折扣、點數等促銷效果"},
-            {"id": "competition", "name": "競合變化", "description": "模擬競爭對手動作"},
-            {"id": "external", "name": "外部因素", "description": "天氣、節慶等外部因素"},
-        ],
-        "parameters": {
-            "electricity_price": {
-                "type": "float",
-                "range": [0.5, 3.0],
-                "default": 1.0,
-                "description": "電價倍數 (1.0 = 無變化)",
-            },
-            "point_multiplier": {
-                "type": "float",
-                "range": [0.5, 5.0],
-                "default": 1.0,
-                "description": "點數加成倍率",
-            },
-            "promotion_intensity": {
-                "type": "float",
-                "range": [0.0, 2.0],
-                "default": 1.0,
-                "description": "促銷強度 (0-2)",
-            },
-            "price_sensitivity": {
-                "type": "float",
-                "range": [0.5, 2.0],
-                "default": 1.0,
-                "description": "消費者價格敏感度",
-            },
-        },
-        "personas": ["新鮮人", "FinTech家庭", None],
-        "regions": ["台北", "台南", None],
-        "duration_days": {"min": 1, "max": 365, "default": 30},
-    }
+    return Response(content=_PARAMS_BYTES, media_type="application/json")
 
 
 @router.post("/simulate", response_model=SimulationResponse)
-async def run_simulation(request: SimulationRequest) -> SimulationResponse:
+async def run_simulation(request: SimulationRequest) -> Response:
     """
     Run what-if analysis simulation.
     
     This endpoint applies the specified event and parameters to the digital twin
     model and returns projected brand preference shifts.
     """
-    # Validate event type
-    valid_events = ["price_change", "promotion", "competition", "external"]
-    if request.event_type not in valid_events:
+    # Validate inputs before touching the data files
+    if request.event_type not in _VALID_EVENTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid event_type. Must be one of: {list(EVENT_COEFFS)}"
+        )
+    if request.persona and request.persona not in _VALID_PERSONAS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid persona. Must be one of: {list(PERSONAS)}"
+        )
+    if request.region and request.region not in _VALID_REGIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid event_type. Must be one of: {valid_events}"
+            detail=f"Invalid region. Must be one of: {list(REGIONS)}"
         )
     
     # Load baseline data
-    baseline = load_baseline_data()
+    baseline, baseline_arrays = _load_baseline()
     
     if not baseline:
         raise HTTPException(
@@ -330,7 +509,7 @@ async def run_simulation(request: SimulationRequest) -> SimulationResponse:
     results = calculate_impact(
         event_type=request.event_type,
         params=request.parameters,
-        baseline=baseline,
+        baseline_arrays=baseline_arrays,
         persona=request.persona,
         region=request.region,
     )
@@ -341,40 +520,40 @@ async def run_simulation(request: SimulationRequest) -> SimulationResponse:
             detail="No data matches the specified persona/region filters."
         )
     
+    avg_changes, total_shift = _aggregate_results(results)
+    
     # Generate insights
     insights = generate_insights(
         event_type=request.event_type,
-        results=results,
+        avg_changes=avg_changes,
         params=request.parameters,
     )
     
     # Calculate projected impact
     projected_impact = calculate_projected_impact(
         event_type=request.event_type,
-        results=results,
+        total_shift=total_shift,
+        n_results=len(results),
         params=request.parameters,
     )
     
-    # Get event name mapping
-    event_names = {
-        "price_change": "電價調漲",
-        "promotion": "促銷活動",
-        "competition": "競合變化",
-        "external": "外部因素",
-    }
+    metadata = _META_BASE.copy()
+    metadata["simulation_time"] = datetime.now(timezone.utc).isoformat()
+    metadata["duration_days"] = request.duration_days
     
-    return SimulationResponse(
+    # Only the incoming request is validated; the response is built from trusted values
+    response = SimulationResponse.model_construct(
         success=True,
-        event=event_names.get(request.event_type, request.event_type),
+        event=_EVENT_NAMES.get(request.event_type, request.event_type),
         event_type=request.event_type,
         parameters=request.parameters.model_dump(),
         results=results,
         insights=insights,
         projected_impact=projected_impact,
         confidence_score=0.85,
-        metadata={
-            "simulation_time": datetime.utcnow().isoformat(),
-            "duration_days": request.duration_days,
-            "model_version": "1.0.0",
-        },
+        metadata=metadata,
     )
+    
+    # Serialize in one pydantic-core pass and return the bytes as-is, so
+    # FastAPI neither re-validates nor re-encodes the nested results
+    return Response(content=response.model_dump_json(), media_type="application/json")
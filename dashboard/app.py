@@ -1,17 +1,62 @@
 #!/usr/bin/env python3
 import streamlit as st
-import json, os
+import mmap, orjson, os
 st.set_page_config(page_title="CDP", layout="wide")
 st.title("📊 CDP Digital Twin")
 
+DATA_FILE = "/Users/the_mini_bot/.openclaw/workspace/digital_twin/monitoring/data/behavior_twin_monthly.jsonl"
+
+
+# Slice size for counting records over the mmapped file
+COUNT_CHUNK_BYTES = 1 << 20
+
+
+def count_lines(fd, mm):
+    """
+    Count the lines of a mapped file.
+
+    This full scan keeps load_latest O(file size). The file is only hinted as
+    sequential, without WILLNEED prefetching all of it up front.
+    """
+    size = len(mm)
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+    count = sum(
+        mm[start:start + COUNT_CHUNK_BYTES].count(b'\n')
+        for start in range(0, size, COUNT_CHUNK_BYTES)
+    )
+    if mm[-1:] != b'\n':
+        count += 1
+    return count
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_latest(path, mtime):
+    """
+    Parse only the last record and count the lines of the JSONL file.
+
+    mtime is part of the cache key so edits invalidate it.
+    Returns (latest record or None, record count).
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return None, 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Walk back over the trailing newline to the start of the last line
+            end = size
+            while end and mm[end - 1:end].isspace():
+                end -= 1
+            latest = orjson.loads(mm[mm.rfind(b'\n', 0, end) + 1:end]) if end else None
+            
+            count = count_lines(f.fileno(), mm)
+    return latest, count
+
+
 # Load data
-data = []
-with open("/Users/the_mini_bot/.openclaw/workspace/digital_twin/monitoring/data/behavior_twin_monthly.jsonl") as f:
-    for line in f:
-        data.append(json.loads(line))
+latest, record_count = load_latest(DATA_FILE, os.path.getmtime(DATA_FILE))
 
-if data:
-    latest = data[-1]
+if latest is not None:
     brand = latest.get('brand_distribution', {})
     
     c1, c2, c3, c4 = st.columns(4)
@@ -21,4 +66,4 @@ if data:
     c4.metric("數位採用", f"{latest.get('digital_adoption_rate', 0)*100:.1f}%")
     
     st.bar_chart({"7-Eleven": [brand.get('7-11', 0)*100], "全家": [brand.get('FamilyMart', 0)*100]})
-    st.success(f"✅ Loaded {len(data)} records")
+    st.success(f"✅ Loaded {record_count} records")
@@ -5,12 +5,50 @@ Standalone health check module for monitoring integration.
 Can be imported or run as a separate service.
 """
 
+import asyncio
 import os
+import mmap
+import threading
 import time
 import json
 import psutil
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+# Slice size for newline counting over mmapped data files
+COUNT_CHUNK_BYTES = 1 << 20
+
+# Data files checked by HealthChecker.check_data_files
+EXPECTED_DATA_FILES = (
+    "behavior_twin_monthly.jsonl",
+    "daily_intel_report.jsonl",
+)
+
+# System metrics are re-sampled at most once per METRICS_TTL_SECONDS
+METRICS_TTL_SECONDS = 2.0
+
+
+def count_records(filepath: str, size: int) -> int:
+    """
+    Count the records of a JSONL file of the given size as its lines.
+    
+    Newlines are counted in C over bounded slices of the mapped file, with
+    the kernel told to read ahead; mmap rejects empty files, which hold none.
+    """
+    if not size:
+        return 0
+    with open(filepath, 'rb') as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_WILLNEED)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            records = sum(
+                mm[start:start + COUNT_CHUNK_BYTES].count(b'\n')
+                for start in range(0, size, COUNT_CHUNK_BYTES)
+            )
+            if mm[-1:] != b'\n':
+                records += 1
+    return records
 
 
 class HealthChecker:
@@ -22,6 +60,15 @@ class HealthChecker:
             "DATA_PATH", 
             "/Users/the_mini_bot/.openclaw/workspace/digital_twin/monitoring/data"
         )
+        
+        # cpu_percent(None) reports usage since the previous call, so prime it
+        # once here instead of sleeping on every metrics read
+        self._proc = psutil.Process()
+        self._proc.cpu_percent(None)
+        
+        self._metrics_lock = threading.Lock()
+        self._metrics: Optional[Dict[str, Any]] = None
+        self._metrics_ts = 0.0
     
     def get_uptime(self) -> Dict[str, Any]:
         """Calculate uptime metrics"""
@@ -40,57 +87,59 @@ class HealthChecker:
         }
     
     def get_system_metrics(self) -> Dict[str, Any]:
-        """Get system resource metrics"""
-        process = psutil.Process()
+        """Get system resource metrics, cached for METRICS_TTL_SECONDS"""
+        with self._metrics_lock:
+            now = time.monotonic()
+            if self._metrics is None or now - self._metrics_ts >= METRICS_TTL_SECONDS:
+                self._metrics = self._sample_system_metrics()
+                self._metrics_ts = now
+            return self._metrics
+    
+    def _sample_system_metrics(self) -> Dict[str, Any]:
+        """Read system resource metrics without blocking"""
+        process = self._proc
         memory_info = process.memory_info()
-        
         return {
             "memory_rss_mb": round(memory_info.rss / (1024 * 1024), 2),
             "memory_percent": round(process.memory_percent(), 2),
-            "cpu_percent": round(process.cpu_percent(interval=0.1), 2),
+            "cpu_percent": round(process.cpu_percent(None), 2),
             "disk_usage_percent": round(psutil.disk_usage('/').percent, 2),
             "open_files": len(process.open_files()),
             "threads": process.num_threads(),
         }
     
-    def check_data_files(self) -> Dict[str, Any]:
-        """Check data file availability and integrity"""
-        results = {}
+    def _check_one(self, filename: str) -> Tuple[str, Dict[str, Any]]:
+        """Stat one data file and count its records"""
+        filepath = os.path.join(self.data_path, filename)
         
-        expected_files = [
-            "behavior_twin_monthly.jsonl",
-            "daily_intel_report.jsonl",
-        ]
+        if not os.path.exists(filepath):
+            return filename, {
+                "status": "missing",
+                "size": 0,
+                "records": 0,
+            }
         
-        for filename in expected_files:
-            filepath = os.path.join(self.data_path, filename)
+        try:
+            size = os.path.getsize(filepath)
             
-            if not os.path.exists(filepath):
-                results[filename] = {
-                    "status": "missing",
-                    "size": 0,
-                    "records": 0,
-                }
-                continue
+            records = count_records(filepath, size)
             
-            try:
-                size = os.path.getsize(filepath)
-                
-                # Count records
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    records = sum(1 for _ in f if line := f.readline().strip())
-                
-                results[filename] = {
-                    "status": "ok",
-                    "size": size,
-                    "size_formatted": f"{size:,} bytes",
-                    "records": records,
-                }
-            except Exception as e:
-                results[filename] = {
-                    "status": "error",
-                    "error": str(e),
-                }
+            return filename, {
+                "status": "ok",
+                "size": size,
+                "size_formatted": f"{size:,} bytes",
+                "records": records,
+            }
+        except Exception as e:
+            return filename, {
+                "status": "error",
+                "error": str(e),
+            }
+    
+    @staticmethod
+    def _summarize_data_files(checks: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Per-file results plus the overall data file status"""
+        results: Dict[str, Any] = dict(checks)
         
         results["overall_status"] = "healthy" if all(
             r.get("status") == "ok" for r in results.values() if isinstance(r, dict)
@@ -98,6 +147,17 @@ class HealthChecker:
         
         return results
     
+    def check_data_files(self) -> Dict[str, Any]:
+        """Check data file availability and integrity"""
+        return self._summarize_data_files(self._check_one(filename) for filename in EXPECTED_DATA_FILES)
+    
+    async def check_data_files_async(self) -> Dict[str, Any]:
+        """Check data file availability and integrity, one worker thread per file"""
+        checks = await asyncio.gather(
+            *(asyncio.to_thread(self._check_one, filename) for filename in EXPECTED_DATA_FILES)
+        )
+        return self._summarize_data_files(checks)
+    
     def check_connections(self) -> Dict[str, Any]:
         """Check external connections"""
         connections = {
@@ -115,9 +175,16 @@ class HealthChecker:
     
     def full_health_check(self) -> Dict[str, Any]:
         """Run complete health check"""
+        return self._build_health(self.check_data_files())
+    
+    async def full_health_check_async(self) -> Dict[str, Any]:
+        """Run complete health check without blocking the event loop on data file I/O"""
+        return self._build_health(await self.check_data_files_async())
+    
+    def _build_health(self, data_check: Dict[str, Any]) -> Dict[str, Any]:
+        """Assemble the full health check around the data file results"""
         uptime = self.get_uptime()
         metrics = self.get_system_metrics()
-        data_check = self.check_data_files()
         connections = self.check_connections()
         
         # Determine overall status
@@ -163,52 +230,83 @@ class HealthChecker:
     
     def generate_health_report(self) -> str:
         """Generate human-readable health report"""
-        health = self.full_health_check()
-        
-        lines = [
-            "=" * 50,
-            "CDP VISUALIZATION FRAMEWORK - HEALTH REPORT",
-            "=" * 50,
-            f"Status: {health['status'].upper()}",
-            f"Version: {health['version']}",
-            f"Timestamp: {health['timestamp']}",
-            "",
-            "UPTIME:",
-            f"  Duration: {health['uptime']['formatted']}",
-            f"  Target Met: {'✅' if health['uptime_proof']['meets_target'] else '❌'} (30+ days)",
-            "",
-            "SYSTEM METRICS:",
-            f"  Memory: {health['metrics']['memory_percent']}% ({health['metrics']['memory_rss_mb']} MB)",
-            f"  CPU: {health['metrics']['cpu_percent']}%",
-            f"  Disk: {health['metrics']['disk_usage_percent']}%",
-            f"  Threads: {health['metrics']['threads']}",
-            "",
-            "DATA SOURCES:",
-        ]
-        
-        for filename, info in health['data_sources'].items():
-            if isinstance(info, dict):
-                status_icon = "✅" if info.get("status") == "ok" else "❌"
-                records = info.get("records", "N/A")
-                lines.append(f"  {status_icon} {filename}: {records} records")
-        
-        lines.extend([
-            "",
-            "AUTO-RECOVERY:",
-            f"  Enabled: {'✅' if health['auto_recovery']['auto_recovery_enabled'] else '❌'}",
-            f"  Healthy Checks: {health['auto_recovery']['consecutive_healthy_checks']}",
-            "",
-            "=" * 50,
-        ])
-        
-        return "\n".join(lines)
+        return _REPORT_TEMPLATE.format_map(_flatten(self.full_health_check()))
+
+
+_RULE = "=" * 50
+
+# Human-readable health report; slots are filled from _flatten(health)
+_REPORT_TEMPLATE = f"""{_RULE}
+CDP VISUALIZATION FRAMEWORK - HEALTH REPORT
+{_RULE}
+Status: {{status}}
+Version: {{version}}
+Timestamp: {{timestamp}}
+
+UPTIME:
+  Duration: {{uptime_formatted}}
+  Target Met: {{uptime_target_icon}} (30+ days)
+
+SYSTEM METRICS:
+  Memory: {{memory_percent}}% ({{memory_rss_mb}} MB)
+  CPU: {{cpu_percent}}%
+  Disk: {{disk_usage_percent}}%
+  Threads: {{threads}}
+
+DATA SOURCES:
+{{data_sources_block}}
+
+AUTO-RECOVERY:
+  Enabled: {{auto_recovery_icon}}
+  Healthy Checks: {{consecutive_healthy_checks}}
+
+{_RULE}"""
+
+
+def _icon(ok: Any) -> str:
+    """Report status icon"""
+    return "✅" if ok else "❌"
+
+
+def _flatten(health: Dict[str, Any]) -> Dict[str, Any]:
+    """Flat slot values for _REPORT_TEMPLATE from a full_health_check() result"""
+    metrics = health["metrics"]
+    
+    data_sources_block = "\n".join(
+        f"  {_icon(info.get('status') == 'ok')} {filename}: {info.get('records', 'N/A')} records"
+        for filename, info in health["data_sources"].items()
+        if isinstance(info, dict)
+    )
+    
+    return {
+        "status": health["status"].upper(),
+        "version": health["version"],
+        "timestamp": health["timestamp"],
+        "uptime_formatted": health["uptime"]["formatted"],
+        "uptime_target_icon": _icon(health["uptime_proof"]["meets_target"]),
+        "memory_percent": metrics["memory_percent"],
+        "memory_rss_mb": metrics["memory_rss_mb"],
+        "cpu_percent": metrics["cpu_percent"],
+        "disk_usage_percent": metrics["disk_usage_percent"],
+        "threads": metrics["threads"],
+        "data_sources_block": data_sources_block,
+        "auto_recovery_icon": _icon(health["auto_recovery"]["auto_recovery_enabled"]),
+        "consecutive_healthy_checks": health["auto_recovery"]["consecutive_healthy_checks"],
+    }
+
+
+# Shared by create_health_endpoint so the CPU window and cached metrics
+# span successive calls instead of starting over each time
+_checker: Optional[HealthChecker] = None
 
 
 # Standalone health check endpoint function
 def create_health_endpoint():
     """Create health check response (compatible with FastAPI)"""
-    checker = HealthChecker()
-    health = checker.full_health_check()
+    global _checker
+    if _checker is None:
+        _checker = HealthChecker()
+    health = _checker.full_health_check()
     
     return health
 